@@ -0,0 +1,74 @@
+"""
+This module provides optional Numba-compiled kernels for airfoil point generation.
+It is imported lazily by mesh_generation, only when a caller opts in with use_numba=True
+and numba is installed.
+"""
+
+import math
+from numba import njit, prange
+
+@njit(inline='always', fastmath=True)
+def _naca0012_y(xi, c0, c1, c2, c3, c4):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """NACA 0012 half-thickness at a single x, with Horner's method for the polynomial."""
+    # Scalar math.sqrt maps directly onto LLVM's sqrt intrinsic, which fastmath lets
+    # LLVM vectorize (vsqrtpd) in the same loop as the polynomial's FMAs.
+    return math.sqrt(xi) * c0 + xi * (c1 + xi * (c2 + xi * (c3 + xi * c4)))
+
+@njit(inline='always', fastmath=True)
+def _fill_airfoil_row(xs, ys, num_points, i, c0, c1, c2, c3, c4):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Writes the upper and lower surface points for x-station i."""
+    # x is generated inline (equivalent to np.linspace(0, 1, num_points)[i]) so no
+    # x array is ever materialized; dividing keeps both trailing edge points at 1.0.
+    xi = i / (num_points - 1) if num_points > 1 else 0.0
+    yi = _naca0012_y(xi, c0, c1, c2, c3, c4)
+
+    # Upper surface (reversed): x from 1 to 0
+    xs[num_points - 1 - i] = xi
+    ys[num_points - 1 - i] = yi
+
+    # Lower surface (skip leading edge point): x from 0 to 1
+    if i > 0:
+        xs[num_points - 1 + i] = xi
+        ys[num_points - 1 + i] = -yi
+
+@njit(parallel=True, fastmath=True, cache=True)
+def fill_airfoil_points(xs, ys, num_points, c0, c1, c2, c3, c4):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Fills pre-allocated xs and ys arrays of length 2 * num_points - 1 with NACA 0012
+    surface points, ordered from the trailing edge over the upper surface.
+
+    Generating x, the square root, the Horner polynomial, the negation for the lower
+    surface and the stores for both surfaces are fused into a single streaming pass.
+    """
+    for i in prange(num_points): # pylint: disable=not-an-iterable
+        _fill_airfoil_row(xs, ys, num_points, i, c0, c1, c2, c3, c4)
+
+@njit(fastmath=True, cache=True)
+def fill_airfoil_points_serial(xs, ys, num_points, c0, c1, c2, c3, c4):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Single-threaded variant of fill_airfoil_points.
+    Avoids the thread pool dispatch, which dominates for small inputs.
+    """
+    for i in range(num_points):
+        _fill_airfoil_row(xs, ys, num_points, i, c0, c1, c2, c3, c4)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def naca0012_y_kernel(x, out, c0, c1, c2, c3, c4):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Evaluates the NACA 0012 half-thickness for every element of the 1D array x into out.
+    The square root and the Horner polynomial are fused into a single pass over x.
+    """
+    for i in prange(x.shape[0]): # pylint: disable=not-an-iterable
+        out[i] = _naca0012_y(x[i], c0, c1, c2, c3, c4)
+
+@njit(fastmath=True, cache=True)
+def naca0012_y_kernel_serial(x, out, c0, c1, c2, c3, c4):
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Single-threaded variant of naca0012_y_kernel for small inputs."""
+    for i in range(x.shape[0]):
+        out[i] = _naca0012_y(x[i], c0, c1, c2, c3, c4)
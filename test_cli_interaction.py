@@ -3,39 +3,49 @@ Tests for the CLI interaction logic in mesh_generation.py.
 """
 import unittest
 import os
+import tempfile
+import time
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 import numpy as np
+import pytest
 import mesh_generation
 
 class TestDirectoryCreation(unittest.TestCase):
     """Tests for directory creation logic."""
 
-    @patch('os.makedirs')
-    @patch('os.path.exists', return_value=True)
-    def test_directory_exists(self, mock_exists, mock_makedirs):
-        """Test that nothing happens if directory exists."""
-        # pylint: disable=unused-argument
+    @patch('sys.stdout', new_callable=StringIO)
+    @patch('os.makedirs', side_effect=FileExistsError)
+    def test_directory_exists(self, mock_makedirs, mock_stdout):
+        """Test that nothing is reported if the directory already exists."""
         mesh_generation.ensure_directory_exists("existing_dir/file.msh")
-        mock_makedirs.assert_not_called()
+        mock_makedirs.assert_called_once_with("existing_dir")
+        self.assertNotIn("Created directory", mock_stdout.getvalue())
 
     @patch('sys.stdout', new_callable=StringIO)
     @patch('os.makedirs')
-    @patch('os.path.exists', return_value=False)
-    def test_directory_does_not_exist(self, mock_exists, mock_makedirs, mock_stdout):
+    def test_directory_does_not_exist(self, mock_makedirs, mock_stdout):
         """Test that directory is created if it does not exist."""
-        # pylint: disable=unused-argument
         # Note: os.path.dirname("new_dir/file.msh") -> "new_dir"
         mesh_generation.ensure_directory_exists("new_dir/file.msh")
-        mock_makedirs.assert_called_with("new_dir", exist_ok=True)
+        mock_makedirs.assert_called_with("new_dir")
         self.assertIn("Created directory 'new_dir'", mock_stdout.getvalue())
 
+    @patch('sys.stdout', new_callable=StringIO)
+    @patch('os.path.isdir', return_value=True)
+    @patch('os.makedirs', side_effect=PermissionError("Permission denied"))
+    def test_existing_directory_other_error(self, mock_makedirs, mock_isdir, mock_stdout):
+        """Test that an existing directory is accepted even if mkdir fails with another error."""
+        mesh_generation.ensure_directory_exists("existing_dir/file.msh")
+        mock_makedirs.assert_called_once_with("existing_dir")
+        mock_isdir.assert_called_once_with("existing_dir")
+        self.assertEqual(mock_stdout.getvalue(), "")
+
     @patch('sys.stdout', new_callable=StringIO)
     @patch('os.makedirs')
-    @patch('os.path.exists', return_value=False)
-    def test_directory_creation_fails(self, mock_exists, mock_makedirs, mock_stdout):
+    def test_directory_creation_fails(self, mock_makedirs, mock_stdout):
         """Test that script exits if directory creation fails."""
-        # pylint: disable=unused-argument
         mock_makedirs.side_effect = OSError("Permission denied")
         with self.assertRaises(SystemExit) as cm:
             mesh_generation.ensure_directory_exists("root_dir/file.msh")
@@ -48,97 +58,46 @@ class TestDirectoryCreation(unittest.TestCase):
         mesh_generation.ensure_directory_exists(None)
         mock_makedirs.assert_not_called()
 
-class TestMeshGenerationCLI(unittest.TestCase):
-    """Tests for CLI interaction logic."""
-    def setUp(self):
-        self.test_file = "test_verify.msh"
-        # Ensure file exists for some tests
-        with open(self.test_file, 'w', encoding='utf-8') as f:
-            f.write("dummy")
-
-    def tearDown(self):
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-
-    @patch('sys.stdout.isatty', return_value=True)
-    @patch('builtins.input', return_value='y')
-    def test_overwrite_yes_interactive(self, mock_input, mock_isatty):
-        """Test interactive overwrite confirmation (Yes)"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite -> y")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertTrue(result)
-        mock_input.assert_called_once()
-
-    @patch('sys.stdout.isatty', return_value=True)
-    @patch('builtins.input', return_value='yes')
-    def test_overwrite_full_yes_interactive(self, mock_input, mock_isatty):
-        """Test interactive overwrite confirmation (full 'yes')"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite -> yes")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertTrue(result)
-
-    @patch('sys.stdout.isatty', return_value=True)
-    @patch('builtins.input', return_value='YES')
-    def test_overwrite_case_insensitive_interactive(self, mock_input, mock_isatty):
-        """Test interactive overwrite confirmation (case insensitive 'YES')"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite -> YES")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertTrue(result)
-
-    @patch('sys.stdout.isatty', return_value=True)
-    @patch('builtins.input', return_value='n')
-    def test_overwrite_no_interactive(self, mock_input, mock_isatty):
-        """Test interactive overwrite confirmation (No)"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite -> n")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertFalse(result)
-        mock_input.assert_called_once()
-
-    @patch('sys.stdout.isatty', return_value=True)
-    @patch('builtins.input', return_value='NO')
-    def test_overwrite_no_upper_interactive(self, mock_input, mock_isatty):
-        """Test interactive overwrite confirmation (NO)"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite -> NO")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertFalse(result)
-
-    @patch('sys.stdout.isatty', return_value=True)
-    @patch('builtins.input', return_value='')
-    def test_overwrite_empty_interactive(self, mock_input, mock_isatty):
-        """Test interactive overwrite confirmation (Empty input)"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite -> Empty")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertFalse(result)
-
-    @patch('sys.stdout.isatty', return_value=True)
-    def test_overwrite_force_interactive(self, mock_isatty):
-        """Test interactive overwrite with --force (should skip prompt)"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Interactive Overwrite + Force")
-        result = mesh_generation.check_overwrite(self.test_file, force=True)
-        self.assertTrue(result)
+    @patch('os.makedirs')
+    def test_no_directory_component(self, mock_makedirs):
+        """Test that a bare filename in the current directory creates nothing."""
+        mesh_generation.ensure_directory_exists("file.msh")
+        mock_makedirs.assert_not_called()
 
-    @patch('sys.stdout.isatty', return_value=False)
-    def test_overwrite_non_interactive(self, mock_isatty):
-        """Test non-interactive overwrite (should warn but proceed)"""
-        # pylint: disable=unused-argument
-        print("\nTesting: Non-interactive Overwrite")
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertTrue(result)
-
-    def test_new_file(self):
-        """Test checking a non-existent file (should proceed)"""
-        print("\nTesting: New File")
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
-        result = mesh_generation.check_overwrite(self.test_file, force=False)
-        self.assertTrue(result)
+@pytest.fixture(name='existing_mesh', scope='module')
+def existing_mesh_fixture(tmp_path_factory):
+    """A dummy mesh file shared by the overwrite tests, which only read it."""
+    path = tmp_path_factory.mktemp("overwrite") / "test_verify.msh"
+    path.touch()
+    return str(path)
+
+@pytest.mark.parametrize('answer,expected', [
+    ('y', True), ('yes', True), ('YES', True),
+    ('n', False), ('NO', False), ('', False),
+])
+def test_overwrite_interactive(existing_mesh, answer, expected):
+    """Test interactive overwrite confirmation is case-insensitive and defaults to No."""
+    with patch('sys.stdout.isatty', return_value=True), \
+         patch('builtins.input', return_value=answer) as mock_input:
+        result = mesh_generation.check_overwrite(existing_mesh, force=False)
+    assert result is expected
+    mock_input.assert_called_once()
+
+def test_overwrite_force_interactive(existing_mesh):
+    """Test interactive overwrite with --force (should skip prompt)"""
+    with patch('sys.stdout.isatty', return_value=True), \
+         patch('builtins.input') as mock_input:
+        assert mesh_generation.check_overwrite(existing_mesh, force=True)
+    mock_input.assert_not_called()
+
+def test_overwrite_non_interactive(existing_mesh):
+    """Test non-interactive overwrite (should warn but proceed)"""
+    with patch('sys.stdout.isatty', return_value=False):
+        assert mesh_generation.check_overwrite(existing_mesh, force=False)
+
+def test_new_file(tmp_path):
+    """Test checking a non-existent file (should proceed)"""
+    assert mesh_generation.check_overwrite(str(tmp_path / "new.msh"), force=False)
 
 class TestOutputPathValidation(unittest.TestCase):
     """Tests for output path validation."""
@@ -256,6 +215,20 @@ class TestSpinner(unittest.TestCase):
             self.assertIn("Testing...", output, "Should print message in non-TTY mode")
             self.assertNotIn("\033[?25l", output, "Should NOT hide cursor in non-TTY mode")
 
+    def test_spinner_non_tty_no_thread(self):
+        """Test that a non-TTY spinner never creates an animation thread or delay timer."""
+        for min_duration in (0.0, 2.0):
+            with patch('sys.stdout', new_callable=StringIO) as mock_stdout, \
+                 patch('threading.Thread') as mock_thread, \
+                 patch('threading.Timer') as mock_timer:
+                mock_stdout.isatty = lambda: False
+                with mesh_generation.Spinner("Testing...", min_duration=min_duration):
+                    pass
+
+                mock_thread.assert_not_called()
+                mock_timer.assert_not_called()
+                self.assertIn("Testing... ✅", mock_stdout.getvalue())
+
     def test_spinner_non_tty_completion(self):
         """Test spinner completion feedback in non-TTY mode."""
         # pylint: disable=unused-argument
@@ -297,6 +270,72 @@ class TestSpinner(unittest.TestCase):
             # It should appear exactly once
             self.assertEqual(output.count("Testing..."), 1, "Message should appear exactly once")
 
+    def test_spinner_frames_raw_fd(self):
+        """Test that animation frames are written straight to stdout's file descriptor."""
+        read_fd, write_fd = os.pipe()
+        # Never block on the read if no frame was written, e.g. with NO_COLOR set
+        os.set_blocking(read_fd, False)
+        try:
+            with patch.dict(os.environ), \
+                 patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                os.environ.pop("NO_COLOR", None)
+                mock_stdout.isatty = lambda: True
+                mock_stdout.fileno = lambda: write_fd
+                spinner = mesh_generation.Spinner("Testing...")
+                with spinner:
+                    time.sleep(0.05)
+
+                try:
+                    raw_output = os.read(read_fd, 4096).decode("utf-8")
+                except BlockingIOError:
+                    raw_output = ""
+                self.assertIn("\rTesting... ⠋", raw_output, "Should write frames to the fd")
+                self.assertNotIn("⠋", mock_stdout.getvalue(), "Frames should bypass the stream")
+                self.assertIn("Testing... ✅", mock_stdout.getvalue())
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_spinner_delayed_fast_block(self):
+        """Test that a delayed spinner never starts its thread for a short block."""
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            mock_stdout.isatty = lambda: True
+            spinner = mesh_generation.Spinner("Testing...", min_duration=10)
+            with spinner:
+                pass
+
+            output = mock_stdout.getvalue()
+            self.assertIsNone(spinner.thread, "Should not start the animation thread")
+            self.assertNotIn("\033[?25l", output, "Should not hide cursor if never animated")
+            self.assertIn("Testing... ✅", output, "Should print completion feedback")
+
+    def test_spinner_static(self):
+        """Test that a spinner with min_duration=None starts no timer or thread in a TTY."""
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            mock_stdout.isatty = lambda: True
+            spinner = mesh_generation.Spinner("Testing...", min_duration=None)
+            with spinner:
+                pass
+
+            output = mock_stdout.getvalue()
+            self.assertIsNone(spinner.timer, "Should not start the delay timer")
+            self.assertIsNone(spinner.thread, "Should not start the animation thread")
+            self.assertNotIn("\033[?25l", output, "Should not hide cursor")
+            self.assertIn("Testing... ✅", output, "Should print completion feedback")
+
+    def test_spinner_delayed_slow_block(self):
+        """Test that a delayed spinner starts animating once min_duration has elapsed."""
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            mock_stdout.isatty = lambda: True
+            spinner = mesh_generation.Spinner("Testing...", min_duration=0.01)
+            with spinner:
+                time.sleep(0.2)
+
+            output = mock_stdout.getvalue()
+            self.assertIsNotNone(spinner.thread, "Should start the animation thread")
+            self.assertIn("\033[?25l", output, "Should hide cursor once animated")
+            self.assertIn("\033[?25h", output, "Should show cursor after spinner")
+
     @patch('threading.Thread')
     @patch.dict(os.environ, {"NO_COLOR": "1"})
     def test_spinner_no_color(self, mock_thread):
@@ -315,67 +354,77 @@ class TestSpinner(unittest.TestCase):
 
 class TestMeshStatistics(unittest.TestCase):
     """Tests for the mesh statistics output."""
+    def setUp(self):
+        # gmsh is mocked, so nothing writes a mesh here; the file only has to exist for
+        # os.path.getsize. A unique name keeps concurrent runs from clobbering each other.
+        with tempfile.NamedTemporaryFile(suffix='.msh', delete=False) as f:
+            self.output_file = f.name
+
+    def tearDown(self):
+        Path(self.output_file).unlink(missing_ok=True)
+
+    @staticmethod
+    def mock_gmsh():
+        """
+        Returns a gmsh mock reporting canned mesh counts, so the formatting logic is
+        tested without paying for the real engine's initialization and meshing.
+        """
+        mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
+        counts = {"Mesh.NbNodes": 100, "Mesh.NbTriangles": 120, "Mesh.NbQuadrangles": 30}
+        mock_gmsh.option.getNumber.side_effect = lambda name: counts.get(name, 0)
+        return mock_gmsh
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_output_format_with_file(self, mock_stdout):
         """Test that the output format includes element breakdown and tip when file is saved."""
         # Use a small number of points for speed
         points = mesh_generation.generate_airfoil_points(20)
-        output_file = "test_stats.msh"
+        output_file = self.output_file
 
-        try:
-            # We don't need to actually write to disk for the logic test, but the function does.
-            # We can let it write and then clean up.
+        with patch.dict('sys.modules', {'gmsh': self.mock_gmsh()}):
             mesh_generation.generate_gmsh_mesh(points, output_file)
 
-            output = mock_stdout.getvalue()
-            self.assertIn("Mesh Statistics:", output)
-            self.assertIn("Triangles:", output)
-            self.assertIn("Quads:", output)
-            self.assertIn(
-                f"Tip: View the mesh using gmsh {output_file} or run with --preview next time",
-                output
-            )
-
-        finally:
-            if os.path.exists(output_file):
-                os.remove(output_file)
+        output = mock_stdout.getvalue()
+        self.assertIn("Mesh Statistics:", output)
+        self.assertIn("Elements:   150", output)
+        self.assertIn("Triangles:", output)
+        self.assertIn("Quads:", output)
+        self.assertIn(
+            f"Tip: View the mesh using gmsh {output_file} or run with --preview next time",
+            output
+        )
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_output_format_with_file_and_preview(self, mock_stdout):
         """Test that the output format gives a contextual tip when preview=True."""
         points = mesh_generation.generate_airfoil_points(20)
-        output_file = "test_stats_preview.msh"
+        output_file = self.output_file
 
-        mock_gmsh = MagicMock()
+        mock_gmsh = self.mock_gmsh()
 
         # Mock environment to simulate NO display, so fltk.run doesn't block
         env = os.environ.copy()
         if "DISPLAY" in env:
             del env["DISPLAY"]
 
-        try:
-            with patch.dict(os.environ, env, clear=True), \
-                 patch('sys.platform', "linux"), \
-                 patch('sys.stdout.isatty', return_value=True), \
-                 patch('os.path.getsize', return_value=1024), \
-                 patch.dict('sys.modules', {'gmsh': mock_gmsh}):
-
-                mesh_generation.generate_gmsh_mesh(points, output_file, preview=True)
+        with patch.dict(os.environ, env, clear=True), \
+             patch('sys.platform', "linux"), \
+             patch('sys.stdout.isatty', return_value=True), \
+             patch('os.path.getsize', return_value=1024), \
+             patch.dict('sys.modules', {'gmsh': mock_gmsh}):
 
-            output = mock_stdout.getvalue()
-            self.assertIn("Mesh Statistics:", output)
-            self.assertIn("Triangles:", output)
-            self.assertIn("Quads:", output)
-            self.assertIn(
-                f"Tip: View the mesh later using gmsh {output_file}",
-                output
-            )
-            self.assertNotIn("or run with --preview next time", output)
+            mesh_generation.generate_gmsh_mesh(points, output_file, preview=True)
 
-        finally:
-            if os.path.exists(output_file):
-                os.remove(output_file)
+        output = mock_stdout.getvalue()
+        self.assertIn("Mesh Statistics:", output)
+        self.assertIn("Triangles:", output)
+        self.assertIn("Quads:", output)
+        self.assertIn(
+            f"Tip: View the mesh later using gmsh {output_file}",
+            output
+        )
+        self.assertNotIn("or run with --preview next time", output)
 
     @patch('sys.stdout', new_callable=StringIO)
     def test_output_format_without_file(self, mock_stdout):
@@ -385,7 +434,8 @@ class TestMeshStatistics(unittest.TestCase):
         """
         points = mesh_generation.generate_airfoil_points(20)
 
-        mesh_generation.generate_gmsh_mesh(points, None)
+        with patch.dict('sys.modules', {'gmsh': self.mock_gmsh()}):
+            mesh_generation.generate_gmsh_mesh(points, None)
 
         output = mock_stdout.getvalue()
         self.assertIn("Mesh Statistics:", output)
@@ -399,6 +449,7 @@ class TestMeshStatistics(unittest.TestCase):
 
         # Create a mock gmsh module
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
         mock_gmsh.option.getNumber.return_value = 0
         mock_gmsh.model.getBoundingBox.return_value = (0, 0, 0, 0, 0, 0)
 
@@ -420,6 +471,7 @@ class TestPreviewFlag(unittest.TestCase):
         """Test that preview=True calls gmsh.fltk.run()."""
 
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
 
         # Mock environment to simulate display available
         with patch.dict(os.environ, {"DISPLAY": ":0"}), \
@@ -441,6 +493,7 @@ class TestPreviewFlag(unittest.TestCase):
         """Test that preview is skipped if no display is detected."""
 
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
 
         # Mock environment to simulate NO display
         # Remove DISPLAY if present
@@ -473,6 +526,7 @@ class TestInteractiveSave(unittest.TestCase):
         """Test that user can save to default file interactively."""
 
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
         mock_gmsh.option.getNumber.return_value = 0
 
         with patch.dict('sys.modules', {'gmsh': mock_gmsh}):
@@ -497,6 +551,7 @@ class TestInteractiveSave(unittest.TestCase):
     def test_interactive_save_no(self, mock_isatty, mock_input):
         """Test that user can decline saving."""
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
         mock_gmsh.option.getNumber.return_value = 0
 
         with patch.dict('sys.modules', {'gmsh': mock_gmsh}):
@@ -519,6 +574,7 @@ class TestInteractiveSave(unittest.TestCase):
         # pylint: disable=unused-argument
 
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
         mock_gmsh.option.getNumber.return_value = 0
 
         with patch.dict('sys.modules', {'gmsh': mock_gmsh}):
@@ -538,6 +594,7 @@ class TestInteractiveSave(unittest.TestCase):
     def test_non_interactive_no_prompt(self, mock_isatty):
         """Test that prompt is skipped in non-interactive mode."""
         mock_gmsh = MagicMock()
+        mock_gmsh.isInitialized.return_value = False
         mock_gmsh.option.getNumber.return_value = 0
 
         with patch.dict('sys.modules', {'gmsh': mock_gmsh}), \
@@ -1,9 +1,16 @@
 """
 Tests for the mesh_generation module.
 """
+import os
+import sys
+from unittest.mock import patch, MagicMock
 import numpy as np
-from mesh_generation import generate_airfoil_points, generate_gmsh_mesh, format_size
-from benchmark_mesh_generation import generate_airfoil_points_slow
+import pytest
+from mesh_generation import generate_airfoil_points, generate_gmsh_mesh, format_size, gmsh_version
+from mesh_generation import load_or_generate_airfoil_points, naca0012_y, airfoil_cache_path
+from mesh_generation import AirfoilCoords, CACHE_MIN_POINTS, main
+from benchmark_mesh_generation import generate_airfoil_points_slow, generate_airfoil_points_parallel
+from benchmark_mesh_generation import verify_points, generate_airfoil_points_reference
 
 def test_format_size():
     """Test the format_size utility function."""
@@ -13,6 +20,8 @@ def test_format_size():
     assert format_size(1536) == "1.5 KB"
     assert format_size(1024 * 1024) == "1.0 MB"
     assert format_size(1024 * 1024 * 1024) == "1.0 GB"
+    assert format_size(1024 ** 5) == "1.0 PB"
+    assert format_size(2048 * 1024 ** 5) == "2048.0 PB"
 
 def test_generate_gmsh_mesh_runs():
     """Test that generate_gmsh_mesh runs without error (and exercises Spinner)."""
@@ -20,30 +29,304 @@ def test_generate_gmsh_mesh_runs():
     # Just ensure it doesn't crash
     generate_gmsh_mesh(points)
 
+@pytest.mark.parametrize("closed, expected_points", [(True, 4), (False, 5)])
+def test_generate_gmsh_mesh_skips_closing_point(closed, expected_points):
+    """Test that a repeated closing point is not added to Gmsh a second time."""
+    points = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0]], dtype=float)
+    if not closed:
+        points[-1, 1] = 0.5
+    mock_gmsh = MagicMock()
+    mock_gmsh.isInitialized.return_value = False
+    mock_gmsh.option.getNumber.return_value = 0
+    mock_gmsh.model.geo.addPoint.side_effect = range(1, 10)
+
+    with patch.dict("sys.modules", {"gmsh": mock_gmsh}):
+        generate_gmsh_mesh(points)
+
+    assert mock_gmsh.model.geo.addPoint.call_count == expected_points
+    polyline_tags = mock_gmsh.model.geo.addPolyline.call_args[0][0]
+    assert list(polyline_tags) == list(range(1, expected_points + 1)) + [1]
+
+def test_bounding_box_from_points(capsys):
+    """Test that the bounding box is computed from the input points, not queried from Gmsh."""
+    mock_gmsh = MagicMock()
+    mock_gmsh.isInitialized.return_value = False
+    mock_gmsh.option.getNumber.return_value = 0
+
+    with patch.dict("sys.modules", {"gmsh": mock_gmsh}):
+        generate_gmsh_mesh(generate_airfoil_points(50))
+
+    mock_gmsh.model.getBoundingBox.assert_not_called()
+    output = capsys.readouterr().out
+    assert "X Range" in output and "1.0000" in output
+    assert "-0.0600" in output
+
+@pytest.mark.parametrize("initialized, fail", [(False, False), (False, True), (True, False)])
+def test_generate_gmsh_mesh_session_ownership(initialized, fail):
+    """Test that an open Gmsh session is reused, and only a session started here is finalized."""
+    mock_gmsh = MagicMock()
+    mock_gmsh.isInitialized.return_value = initialized
+    mock_gmsh.option.getNumber.return_value = 0
+    if fail:
+        mock_gmsh.model.mesh.generate.side_effect = RuntimeError("meshing failed")
+
+    with patch.dict("sys.modules", {"gmsh": mock_gmsh}):
+        assert generate_gmsh_mesh(generate_airfoil_points(10)) is not fail
+
+    assert mock_gmsh.initialize.called is not initialized
+    assert mock_gmsh.finalize.called is not initialized
+    mock_gmsh.clear.assert_not_called()
+    assert mock_gmsh.model.remove.called is initialized
+
+def test_generate_gmsh_mesh_restores_reused_session():
+    """Test that a caller's Gmsh session keeps its models, current model and options."""
+    try:
+        import gmsh # pylint: disable=import-outside-toplevel
+    except (ImportError, OSError) as e:
+        # gmsh may be installed but fail to load its shared libraries (OSError)
+        pytest.skip(f"gmsh is not available: {e}")
+    gmsh.initialize()
+    try:
+        gmsh.option.setNumber("General.Verbosity", 0)
+        gmsh.option.setNumber("Mesh.CharacteristicLengthMax", 0.5)
+        gmsh.model.add("airfoil")
+        gmsh.model.geo.addPoint(0, 0, 0)
+        gmsh.model.geo.synchronize()
+        gmsh.option.setNumber("General.Verbosity", 2)
+
+        assert generate_gmsh_mesh(generate_airfoil_points(20))
+
+        assert gmsh.isInitialized()
+        assert gmsh.model.list() == ["", "airfoil"]
+        assert gmsh.model.getCurrent() == "airfoil"
+        assert gmsh.model.getEntities() == [(0, 1)]
+        assert gmsh.option.getNumber("Mesh.CharacteristicLengthMax") == 0.5
+        assert gmsh.option.getNumber("General.Verbosity") == 2
+    finally:
+        gmsh.finalize()
+
 def test_points_match():
-    """Test that slow and fast methods produce identical points."""
+    """Test that the fast method matches the vectorized textbook reference."""
     num_points = 1000
+    points_reference = generate_airfoil_points_reference(num_points)
+    points_fast = generate_airfoil_points(num_points).to_array()
+
+    assert np.allclose(points_reference, points_fast), "Points do not match!"
+
+def test_slow_baseline_matches_reference():
+    """Test that the benchmark's loop-based baseline matches the vectorized reference."""
+    num_points = 101
     points_slow = np.array(generate_airfoil_points_slow(num_points))
-    points_fast = generate_airfoil_points(num_points)
+    assert np.allclose(points_slow, generate_airfoil_points_reference(num_points))
+
+def test_parallel_baseline_matches_slow():
+    """Test that the multiprocessing benchmark baseline matches the single-process one."""
+    num_points = 101
+    assert generate_airfoil_points_parallel(num_points, processes=2) == \
+        generate_airfoil_points_slow(num_points)
+
+def test_verify_points_sampled():
+    """Test that the sampled benchmark verification accepts correct points and rejects bad ones."""
+    num_points = 100
+    coords = generate_airfoil_points(num_points)
+    assert verify_points(coords, num_points)
+
+    points_slow = generate_airfoil_points_slow(num_points)
+    assert verify_points(coords, num_points, points_slow=points_slow)
+    points_slow[150][1] += 1e-3
+    assert not verify_points(coords, num_points, samples=2 * num_points - 1,
+                             points_slow=points_slow)
 
-    assert np.allclose(points_slow, points_fast), "Points do not match!"
+    coords.y[150] += 1e-3
+    assert not verify_points(coords, num_points, samples=2 * num_points - 1)
 
 def test_shape():
     """Test that the output shape is correct."""
     num_points = 100
-    points = generate_airfoil_points(num_points)
+    points = generate_airfoil_points(num_points).to_array()
     # Expected shape: (2 * num_points - 1, 3)
     expected_rows = 2 * num_points - 1
     assert points.shape == (expected_rows, 3), \
         f"Expected shape ({expected_rows}, 3), got {points.shape}"
 
+def test_soa_layout():
+    """Test that x and y are contiguous 1D arrays of the same length and z is implicit."""
+    num_points = 100
+    coords = generate_airfoil_points(num_points)
+    assert len(coords) == 2
+    for axis in coords:
+        assert axis.shape == (2 * num_points - 1,)
+        assert axis.flags.c_contiguous
+    assert coords.z.shape == coords.x.shape
+    assert np.all(coords.z == 0.0)
+
+def test_from_array_2d_and_3d_points():
+    """Test that (N, 2) and (N, 3) points keep their columns and other shapes are rejected."""
+    square = np.array([[0, 0], [1, 0], [1, 1], [0, 1], [0.5, 1.5], [0, 0]], dtype=float)
+    for points in (square, np.column_stack((square, np.zeros(len(square))))):
+        coords = AirfoilCoords.from_array(points)
+        assert np.array_equal(coords.x, square[:, 0])
+        assert np.array_equal(coords.y, square[:, 1])
+
+    for bad in (np.zeros(6), np.zeros((4, 4)), np.zeros((2, 3, 3))):
+        with pytest.raises(ValueError):
+            AirfoilCoords.from_array(bad)
+
+@pytest.mark.parametrize("num_points", [1, 2, 49, 1000])
+def test_numpy_path_x_matches_linspace(num_points):
+    """Test that the NumPy path's x stations are exactly np.linspace(0, 1, num_points)."""
+    with patch("mesh_generation.load_airfoil_kernels", return_value=None):
+        coords = generate_airfoil_points(num_points)
+    assert np.array_equal(coords.x[num_points - 1:], np.linspace(0, 1, num_points))
+
+def test_float32_points():
+    """Test that single-precision points match the double-precision ones."""
+    expected = generate_airfoil_points(1000).to_array()
+    # Goes through the Numba kernels when numba is installed
+    coords32 = generate_airfoil_points(1000, dtype=np.float32, use_numba=True)
+    coords32_numpy = generate_airfoil_points(1000, dtype=np.float32)
+
+    for coords in (coords32, coords32_numpy):
+        assert all(axis.dtype == np.float32 for axis in coords)
+        assert np.allclose(coords.to_array(), expected, atol=1e-6)
+
 def test_trailing_edge_x():
     """Test that the trailing edge is at x=1."""
     num_points = 100
-    points = generate_airfoil_points(num_points)
+    coords = generate_airfoil_points(num_points)
+
+    assert np.isclose(coords.x[0], 1.0), "First point x should be 1.0"
+    assert np.isclose(coords.x[-1], 1.0), "Last point x should be 1.0"
+
+@pytest.mark.parametrize("num_points", [1000, 5000])
+def test_numba_kernel_matches_numpy(num_points):
+    """Test that the optional Numba kernels produce the same points as the NumPy path."""
+    pytest.importorskip("numba")
+    points_numba = generate_airfoil_points(num_points, use_numba=True).to_array()
+    points_numpy = generate_airfoil_points(num_points).to_array()
+
+    assert points_numba.shape == points_numpy.shape
+    assert np.allclose(points_numba, points_numpy), "Numba and NumPy points do not match!"
+
+@pytest.mark.parametrize("num_points", [100, 5000])
+def test_numba_naca0012_y_matches_numpy(num_points):
+    """Test that the Numba naca0012_y kernel matches the NumPy ufunc sequence."""
+    pytest.importorskip("numba")
+    x = np.linspace(0, 1, num_points)
+    out = np.empty_like(x)
+    y_numba = naca0012_y(x, use_numba=True)
+    assert naca0012_y(x, out=out, use_numba=True) is out
+    y_numpy = naca0012_y(x)
+
+    assert np.allclose(y_numba, y_numpy)
+    assert np.allclose(out, y_numpy)
+
+def test_naca0012_y_numpy_scalar_thickness():
+    """Test that NumPy scalar thicknesses work despite the cached coefficients."""
+    x = np.linspace(0, 1, 50)
+    expected = naca0012_y(x, t=0.12)
+    assert np.allclose(naca0012_y(x, t=np.array(0.12)), expected)
+    assert np.allclose(naca0012_y(x, t=np.float32(0.12)), expected)
+
+def test_kernels_are_opt_in():
+    """Test that the Numba kernels are only loaded when a caller passes use_numba=True."""
+    with patch("mesh_generation.load_airfoil_kernels") as mock_load:
+        generate_airfoil_points(100)
+        naca0012_y(np.linspace(0, 1, 100))
+        mock_load.assert_not_called()
+
+    with patch("mesh_generation.load_airfoil_kernels", return_value=None) as mock_load:
+        coords = generate_airfoil_points(100, use_numba=True)
+        mock_load.assert_called_once()
+    # Without numba installed, use_numba falls back to the NumPy path
+    assert np.allclose(coords.to_array(), generate_airfoil_points(100).to_array())
+
+def test_gmsh_version():
+    """Test that the Gmsh version string is parsed into a comparable tuple."""
+    mock_gmsh = MagicMock()
+    mock_gmsh.option.getString.return_value = "4.15.2"
+    assert gmsh_version(mock_gmsh) == (4, 15)
+
+    mock_gmsh.option.getString.return_value = "unknown"
+    assert not gmsh_version(mock_gmsh)
+
+def test_airfoil_points_cache(tmp_path):
+    """Test that cached airfoil points are written once and reloaded without regenerating."""
+    cache_path = tmp_path / "cache" / "naca0012_50_t0.12.npy"
+    expected = generate_airfoil_points(50).to_array()
+
+    first = load_or_generate_airfoil_points(50, str(cache_path))
+    assert cache_path.is_file()
+    assert np.allclose(first.to_array(), expected)
+
+    with patch("mesh_generation.generate_airfoil_points") as mock_generate:
+        second = load_or_generate_airfoil_points(50, str(cache_path))
+        mock_generate.assert_not_called()
+    assert np.allclose(second.to_array(), expected)
+
+def test_airfoil_cache_path(tmp_path):
+    """Test the cache location for XDG_CACHE_HOME and the home directory, and no cache without."""
+    with patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}):
+        assert airfoil_cache_path(100) == \
+            os.path.join(str(tmp_path), "deepflow", "naca0012_v1_100_t0.12.npy")
+
+    with patch.dict("os.environ", {"XDG_CACHE_HOME": ""}), \
+         patch("os.path.expanduser", return_value="/home/user"):
+        assert airfoil_cache_path(100).startswith(os.path.join("/home/user", ".cache", "deepflow"))
+
+    with patch.dict("os.environ", {"XDG_CACHE_HOME": ""}), \
+         patch("os.path.expanduser", return_value="~"):
+        assert airfoil_cache_path(100) is None
+
+@pytest.mark.parametrize("num_points, no_cache, cached", [
+    (100, False, False),
+    (CACHE_MIN_POINTS, False, True),
+    (CACHE_MIN_POINTS, True, False),
+])
+def test_main_cache_wiring(tmp_path, num_points, no_cache, cached):
+    """Test that main() only uses the disk cache for large inputs and honors --no-cache."""
+    argv = ["mesh_generation.py", "-n", str(num_points)] + (["--no-cache"] if no_cache else [])
+    with patch.object(sys, "argv", argv), \
+         patch.dict("os.environ", {"XDG_CACHE_HOME": str(tmp_path)}), \
+         patch("mesh_generation.load_or_generate_airfoil_points") as mock_load, \
+         patch("mesh_generation.generate_gmsh_mesh", return_value=True):
+        main()
+        expected_path = airfoil_cache_path(num_points) if cached else None
+
+    mock_load.assert_called_once_with(num_points, expected_path)
+
+def test_airfoil_points_cache_write_uses_mkstemp(tmp_path):
+    """Test that the cache is written only through a mkstemp file in the cache directory."""
+    import tempfile # pylint: disable=import-outside-toplevel
+    cache_path = tmp_path / "naca0012_50_t0.12.npy"
+
+    with patch("tempfile.mkstemp", wraps=tempfile.mkstemp) as mock_mkstemp, \
+         patch("os.open", wraps=os.open) as mock_os_open, \
+         patch("builtins.open", wraps=open) as mock_open, \
+         patch("os.replace", wraps=os.replace) as mock_replace:
+        load_or_generate_airfoil_points(50, str(cache_path))
+
+    mock_mkstemp.assert_called_once()
+    assert mock_mkstemp.call_args.kwargs["dir"] == str(tmp_path)
+    # The only file opened for writing is the one mkstemp created (O_EXCL), which is
+    # then renamed over the cache path
+    written = [call.args[0] for call in mock_os_open.call_args_list
+               if call.args[1] & (os.O_WRONLY | os.O_RDWR)]
+    assert len(written) == 1 and written[0].endswith(".tmp")
+    assert os.path.dirname(written[0]) == str(tmp_path)
+    mock_open.assert_not_called()
+    mock_replace.assert_called_once_with(written[0], str(cache_path))
+    assert np.load(cache_path).shape == (2, 99)
+    assert not [p for p in tmp_path.iterdir() if p.suffix == ".tmp"]
 
-    first_point = points[0]
-    last_point = points[-1]
+def test_airfoil_points_cache_invalid(tmp_path):
+    """Test that a corrupt or mismatched cache file is regenerated."""
+    cache_path = tmp_path / "naca0012_50_t0.12.npy"
+    cache_path.write_bytes(b"not a numpy file")
+    coords = load_or_generate_airfoil_points(50, str(cache_path))
+    assert np.allclose(coords.to_array(), generate_airfoil_points(50).to_array())
 
-    assert np.isclose(first_point[0], 1.0), "First point x should be 1.0"
-    assert np.isclose(last_point[0], 1.0), "Last point x should be 1.0"
+    np.save(cache_path, np.zeros((2, 10)))
+    coords = load_or_generate_airfoil_points(50, str(cache_path))
+    assert len(coords.x) == 99
+    assert np.load(cache_path).shape == (2, 99)